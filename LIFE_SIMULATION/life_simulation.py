@@ -16,13 +16,12 @@ import uuid
 import pickle
 import copy
 import random
-from datetime import datetime, timedelta
+from datetime import datetime
 import os
-from functools import reduce
+from functools import lru_cache
+from operator import attrgetter, methodcaller
 
-import mpmath
 from mpmath import mp, mpf
-from tabulate import tabulate
 
 mp.pretty = True
 
@@ -30,6 +29,9 @@ mp.pretty = True
 # Creating static variables to be used throughout the game.
 
 
+MPF_ZERO: mpf = mpf("0")
+MPF_HALF: mpf = mpf("0.5")
+MPF_ONE: mpf = mpf("1")
 LETTERS: str = "abcdefghijklmnopqrstuvwxyz"
 ELEMENT_CHART: list = [
     ["ATTACKING\nELEMENT", "TERRA", "FLAME", "SEA", "NATURE", "ELECTRIC", "ICE", "METAL", "DARK", "LIGHT", "WAR",
@@ -43,12 +45,47 @@ ELEMENT_CHART: list = [
      "OTHER",
      "OTHER", "OTHER", "OTHER"]
 ]
+# Elemental damage multipliers are exact in binary floating point and do not need arbitrary precision. mpmath
+# coerces them when they are multiplied into mpf damage values.
+DOUBLE_DAMAGE_MULTIPLIER: float = 2.0
+HALF_DAMAGE_MULTIPLIER: float = 0.5
+NORMAL_DAMAGE_MULTIPLIER: float = 1.0
+# Elements which do not have any elemental strengths nor weaknesses.
+ANCIENT_WORLD_ELEMENTS: tuple = ("BEAUTY", "MAGIC", "CHAOS", "HAPPY", "DREAM", "SOUL")
+# Damage multipliers of each attacking element against each defending element, read off the columns of
+# ELEMENT_CHART. Any pair not listed here is dealt with normal damage.
+ELEMENTAL_DAMAGE_MULTIPLIERS: dict = {
+    attacking_element: {
+        defending_element: multiplier
+        for defending_elements, multiplier in ((double_damage_elements, DOUBLE_DAMAGE_MULTIPLIER),
+                                               (half_damage_elements, HALF_DAMAGE_MULTIPLIER))
+        for defending_element in defending_elements.split("\n") if defending_element != "N/A"
+    }
+    for attacking_element, double_damage_elements, half_damage_elements
+    in zip(ELEMENT_CHART[0][1:], ELEMENT_CHART[1][1:], ELEMENT_CHART[2][1:])
+}
+MIN_RESISTANCE_ACCURACY_DIFFERENCE: mpf = mpf("0.15")
+# Command used to clear the screen: 'cls' for Windows System, 'clear' for Linux System.
+CLEAR_COMMAND: str = 'cls' if sys.platform.startswith('win') else 'clear'
 
 
 # Creating static functions to be used throughout the game.
 
 
 def is_number(string: str) -> bool:
+    if isinstance(string, (int, float, mpf)):
+        return True  # numeric values do not need to be parsed
+    if isinstance(string, str):
+        return is_number_string(string)
+    try:
+        mpf(string)
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
+@lru_cache(maxsize=4096)
+def is_number_string(string: str) -> bool:
     try:
         mpf(string)
         return True
@@ -56,134 +93,127 @@ def is_number(string: str) -> bool:
         return False
 
 
+@lru_cache(maxsize=1)
 def tabulate_element_chart() -> str:
-    return str(tabulate(ELEMENT_CHART, headers='firstrow', tablefmt='fancy_grid'))
+    # tabulate is only needed to display the element chart, so it is imported on first use.
+    from tabulate import tabulate
+    return tabulate(ELEMENT_CHART, headers='firstrow', tablefmt='fancy_grid')
 
 
 def generate_random_name() -> str:
-    res: str = ""  # initial value
     name_length: int = random.randint(5, 20)
-    for i in range(name_length):
-        res += LETTERS[random.randint(0, len(LETTERS) - 1)]
-
-    return res.capitalize()
+    return "".join(random.choices(LETTERS, k=name_length)).capitalize()
 
 
 def triangular(n: int) -> int:
-    return int(n * (n - 1) / 2)
+    return (n * (n - 1)) >> 1
 
 
 def mpf_sum_of_list(a_list: list) -> mpf:
-    return mpf(str(sum(mpf(str(elem)) for elem in a_list if is_number(str(elem)))))
+    res: mpf = MPF_ZERO  # initial value
+    for elem in a_list:
+        if isinstance(elem, bool):
+            continue  # booleans are not numbers here, as str(True) and str(False) do not parse as numbers
+        try:
+            res += elem if isinstance(elem, mpf) else mpf(elem)
+        except (ValueError, TypeError):
+            pass  # non-numeric elements are skipped
+
+    return res
 
 
 def mpf_product_of_list(a_list: list) -> mpf:
-    return mpf(reduce(lambda x, y: mpf(x) * mpf(y) if is_number(x) and
-                                                      is_number(y) else mpf(x) if is_number(x) and not is_number(
-        y) else mpf(y) if is_number(y) and not is_number(x) else 1, a_list, 1))
-
-
-def get_elemental_damage_multiplier(element1: str, element2: str) -> mpf:
-    if element1 == "TERRA":
-        return mpf("2") if element2 in ["ELECTRIC, DARK"] else mpf("0.5") if element2 in ["METAL", "WAR"] else mpf("1")
-    elif element1 == "FLAME":
-        return mpf("2") if element2 in ["NATURE", "ICE"] else mpf("0.5") if element2 in ["SEA", "WAR"] else mpf("1")
-    elif element1 == "SEA":
-        return mpf("2") if element2 in ["FLAME", "WAR"] else mpf("0.5") if element2 in ["NATURE", "ELECTRIC"] else \
-            mpf("1")
-    elif element1 == "NATURE":
-        return mpf("2") if element2 in ["SEA", "LIGHT"] else mpf("0.5") if element2 in ["FLAME", "ICE"] else mpf("1")
-    elif element1 == "ELECTRIC":
-        return mpf("2") if element2 in ["SEA", "METAL"] else mpf("0.5") if element2 in ["TERRA", "LIGHT"] else mpf("1")
-    elif element1 == "ICE":
-        return mpf("2") if element2 in ["NATURE", "WAR"] else mpf("0.5") if element2 in ["FLAME", "METAL"] else mpf("1")
-    elif element1 == "METAL":
-        return mpf("2") if element2 in ["TERRA", "ICE"] else mpf("0.5") if element2 in ["ELECTRIC", "DARK"] else \
-            mpf("1")
-    elif element1 == "DARK":
-        return mpf("2") if element2 in ["METAL", "LIGHT"] else mpf("0.5") if element2 == "TERRA" else mpf("1")
-    elif element1 == "LIGHT":
-        return mpf("2") if element2 in ["ELECTRIC", "DARK"] else mpf("0.5") if element2 == "NATURE" else mpf("1")
-    elif element1 == "WAR":
-        return mpf("2") if element2 in ["TERRA", "FLAME"] else mpf("0.5") if element2 in ["SEA", "ICE"] else mpf("1")
-    elif element1 == "PURE":
-        return mpf("2") if element2 == "LEGEND" else mpf("0.5") if element2 == "PRIMAL" else mpf("1")
-    elif element1 == "LEGEND":
-        return mpf("2") if element2 == "PRIMAL" else mpf("0.5") if element2 == "PURE" else mpf("1")
-    elif element1 == "PRIMAL":
-        return mpf("2") if element2 == "PURE" else mpf("0.5") if element2 == "LEGEND" else mpf("1")
-    elif element1 == "WIND":
-        return mpf("2") if element2 == "WIND" else mpf("1")
-    else:
-        return mpf("1")
+    res: mpf = MPF_ONE  # initial value
+    for elem in a_list:
+        try:
+            res *= elem if isinstance(elem, mpf) else mpf(elem)
+        except (ValueError, TypeError):
+            pass  # non-numeric elements are skipped
+
+    return res
+
+
+def get_elemental_damage_multiplier(element1: str, element2: str) -> float:
+    multipliers: dict or None = ELEMENTAL_DAMAGE_MULTIPLIERS.get(element1)
+    return NORMAL_DAMAGE_MULTIPLIER if multipliers is None else multipliers.get(element2, NORMAL_DAMAGE_MULTIPLIER)
 
 
 def resistance_accuracy_rule(accuracy: mpf, resistance: mpf) -> mpf:
-    if resistance - accuracy <= mpf("0.15"):
-        return mpf("0.15")
-    else:
-        return resistance - accuracy
+    difference: mpf = resistance - accuracy
+    return MIN_RESISTANCE_ACCURACY_DIFFERENCE if difference <= MIN_RESISTANCE_ACCURACY_DIFFERENCE else difference
 
 
 def load_game_data(file_name):
     # type: (str) -> Game
-    return pickle.load(open(file_name, "rb"))
+    with open(file_name, "rb") as save_file:
+        return pickle.load(save_file)
 
 
 def save_game_data(game_data, file_name):
     # type: (Game, str) -> None
-    pickle.dump(game_data, open(file_name, "wb"))
+    with open(file_name, "wb") as save_file:
+        pickle.dump(game_data, save_file, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 def clear():
     # type: () -> None
-    if sys.platform.startswith('win'):
-        os.system('cls')  # For Windows System
-    else:
-        os.system('clear')  # For Linux System
+    os.system(CLEAR_COMMAND)
 
 
 # Creating necessary classes to be used throughout the game.
 
 
+class ReprMixin:
+    """
+    This class contains the string representation shared by classes in this game.
+    """
+
+    __slots__ = ()
+    _FIELDS: tuple = ()  # names of the attributes stored in __slots__, in the order they are displayed
+
+    def __str__(self):
+        # type: () -> str
+        items: list = [(field, getattr(self, field)) for field in self._FIELDS]
+        if hasattr(self, "__dict__"):
+            items += vars(self).items()
+        return str(type(self).__name__) + "(" + ", ".join(str(key) + "=" + str(value) for key, value in items) + ")"
+
+
 ###########################################
 # MINIGAMES
 ###########################################
 
 
-class Minigame:
+class Minigame(ReprMixin):
     """
     This class contains attributes of a minigame in this game.
     """
 
     POSSIBLE_NAMES: list = ["BOX EATS PLANTS", "MATCH WORD PUZZLE", "MATCH-3 GAME"]
+    __slots__ = _FIELDS = ("name", "already_played")
 
     def __init__(self, name):
         # type: (str) -> None
         self.name: str = name if name in self.POSSIBLE_NAMES else self.POSSIBLE_NAMES[0]
         self.already_played: bool = False
 
-    def reset(self):
-        # type: () -> bool
-        time_now: datetime = datetime.now()
+    def reset(self, time_now=None):
+        # type: (datetime or None) -> bool
+        # Callers resetting many minigames at once can read the clock once and pass the same time to each of them.
+        if time_now is None:
+            time_now = datetime.now()
         if self.already_played and time_now.hour > 0:
             self.already_played = False
             return True
         return False
 
-    def __str__(self):
-        # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
+    def __deepcopy__(self, memo):
+        # type: (dict) -> Minigame
+        # All attributes of a minigame are immutable, so they can be shared with the copy.
+        new_minigame: Minigame = type(self).__new__(type(self))
+        new_minigame.name = self.name
+        new_minigame.already_played = self.already_played
+        return new_minigame
 
     def clone(self):
         # type: () -> Minigame
@@ -200,30 +230,24 @@ class Minigame:
 ###########################################
 
 
-class Action:
+class Action(ReprMixin):
     """
     This class contains attributes of an action which can be carried out during battles.
     """
 
     POSSIBLE_NAMES: list = ["NORMAL ATTACK", "NORMAL HEAL", "USE SKILL"]
+    __slots__ = _FIELDS = ("name",)
 
     def __init__(self, name):
         # type: (str) -> None
         self.name: str = name if name in self.POSSIBLE_NAMES else self.POSSIBLE_NAMES[0]
 
-    def __str__(self):
-        # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
+    def __deepcopy__(self, memo):
+        # type: (dict) -> Action
+        # The name of an action is immutable, so it can be shared with the copy.
+        new_action: Action = type(self).__new__(type(self))
+        new_action.name = self.name
+        return new_action
 
     def clone(self):
         # type: () -> Action
@@ -236,7 +260,7 @@ class AwakenBonus:
     """
 
 
-class Battle:
+class Battle(ReprMixin):
     """
     This class contains attributes of a battle in this game.
     """
@@ -245,20 +269,6 @@ class Battle:
         # type: (Trainer) -> None
         self.trainer1: Trainer = trainer1
 
-    def __str__(self):
-        # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
-
     def clone(self):
         # type: () -> Battle
         return copy.deepcopy(self)
@@ -297,7 +307,7 @@ class TrainerBattle(Battle):
         self.trainer2: Trainer = trainer2
 
 
-class Planet:
+class Planet(ReprMixin):
     """
     This class contains attributes of the planet in this game.
     """
@@ -311,26 +321,12 @@ class Planet:
         # type: () -> list
         return self.__cities
 
-    def __str__(self):
-        # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
-
     def clone(self):
         # type: () -> Planet
         return copy.deepcopy(self)
 
 
-class City:
+class City(ReprMixin):
     """
     This class contains attributes of a city in this game.
     """
@@ -344,20 +340,6 @@ class City:
         # type: () -> list
         return self.__tiles
 
-    def __str__(self):
-        # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
-
     def clone(self):
         # type: () -> City
         return copy.deepcopy(self)
@@ -380,11 +362,15 @@ class CityTile:
 
     def add_game_character(self, game_character):
         # type: (GameCharacter) -> None
-        pass
+        self.__game_characters.append(game_character)
 
     def remove_game_character(self, game_character):
         # type: (GameCharacter) -> bool
-        pass
+        try:
+            self.__game_characters.remove(game_character)
+        except ValueError:
+            return False
+        return True
 
     def __str__(self):
         # type: () -> str
@@ -397,29 +383,17 @@ class CityTile:
         return copy.deepcopy(self)
 
 
-class Portal:
+class Portal(ReprMixin):
     """
     This class contains attributes of a portal from one city to another.
     """
 
+    __slots__ = _FIELDS = ("location_to",)
+
     def __init__(self, location_to):
         # type: (AdventureModeLocation) -> None
         self.location_to: AdventureModeLocation = location_to
 
-    def __str__(self):
-        # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
-
     def clone(self):
         # type: () -> Portal
         return copy.deepcopy(self)
@@ -454,17 +428,6 @@ class GrassTile(CityTile):
         # type: (Building or None) -> None
         CityTile.__init__(self, building)
 
-    def add_game_character(self, game_character):
-        # type: (GameCharacter) -> None
-        self.__game_characters.append(game_character)
-
-    def remove_game_character(self, game_character):
-        # type: (GameCharacter) -> bool
-        if game_character in self.__game_characters:
-            self.__game_characters.remove(game_character)
-            return True
-        return False
-
 
 class PavementTile(CityTile):
     """
@@ -476,19 +439,8 @@ class PavementTile(CityTile):
         # type: (Building or None) -> None
         CityTile.__init__(self, building)
 
-    def add_game_character(self, game_character):
-        # type: (GameCharacter) -> None
-        self.__game_characters.append(game_character)
 
-    def remove_game_character(self, game_character):
-        # type: (GameCharacter) -> bool
-        if game_character in self.__game_characters:
-            self.__game_characters.remove(game_character)
-            return True
-        return False
-
-
-class Building:
+class Building(ReprMixin):
     """
     This class contains attributes of a building in a city.
     """
@@ -502,20 +454,6 @@ class Building:
         # type: () -> list
         return self.__floors
 
-    def __str__(self):
-        # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
-
     def clone(self):
         # type: () -> Building
         return copy.deepcopy(self)
@@ -596,13 +534,14 @@ class Daycare(Building):
 
     def remove_legendary_creature(self, legendary_creature):
         # type: (LegendaryCreature) -> bool
-        if legendary_creature in self.__placed_legendary_creatures:
+        try:
             self.__placed_legendary_creatures.remove(legendary_creature)
-            return True
-        return False
+        except ValueError:
+            return False
+        return True
 
 
-class Floor:
+class Floor(ReprMixin):
     """
     This class contains attributes of a floor in a building.
     """
@@ -614,34 +553,23 @@ class Floor:
 
     def get_tile_at(self, x, y):
         # type: (int, int) -> FloorTile or None
-        if x < 0 or x >= len(self.__floor_tiles[0]) or y < 0 or y >= len(self.__floor_tiles):
+        floor_tiles: list = self.__floor_tiles
+        if not floor_tiles:
             return None
-        return self.__floor_tiles[y][x]
+        if 0 <= x < len(floor_tiles[0]) and 0 <= y < len(floor_tiles):
+            return floor_tiles[y][x]
+        return None
 
     def get_floor_tiles(self):
         # type: () -> list
         return self.__floor_tiles
 
-    def __str__(self):
-        # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
-
     def clone(self):
         # type: () -> Floor
         return copy.deepcopy(self)
 
 
-class FloorTile:
+class FloorTile(ReprMixin):
     """
     This class contains attributes of a tile in a building floor.
     """
@@ -657,29 +585,16 @@ class FloorTile:
 
     def remove_game_character(self, game_character):
         # type: (GameCharacter) -> bool
-        if game_character in self.__game_characters:
+        try:
             self.__game_characters.remove(game_character)
-            return True
-        return False
+        except ValueError:
+            return False
+        return True
 
     def get_game_characters(self):
         # type: () -> list
         return self.__game_characters
 
-    def __str__(self):
-        # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
-
     def clone(self):
         # type: () -> FloorTile
         return copy.deepcopy(self)
@@ -737,7 +652,7 @@ class StaircaseTile(FloorTile):
 ###########################################
 
 
-class LegendaryCreatureInventory:
+class LegendaryCreatureInventory(ReprMixin):
     """
     This class contains attributes of an inventory containing legendary creatures.
     """
@@ -752,35 +667,22 @@ class LegendaryCreatureInventory:
 
     def remove_legendary_creature(self, legendary_creature):
         # type: (LegendaryCreature) -> bool
-        if legendary_creature in self.__legendary_creatures:
+        try:
             self.__legendary_creatures.remove(legendary_creature)
-            return True
-        return False
+        except ValueError:
+            return False
+        return True
 
     def get_legendary_creatures(self):
         # type: () -> list
         return self.__legendary_creatures
 
-    def __str__(self):
-        # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
-
     def clone(self):
         # type: () -> LegendaryCreatureInventory
         return copy.deepcopy(self)
 
 
-class ItemInventory:
+class ItemInventory(ReprMixin):
     """
     This class contains attributes of an inventory containing items.
     """
@@ -795,29 +697,16 @@ class ItemInventory:
 
     def remove_item(self, item):
         # type: (Item) -> bool
-        if item in self.__items:
+        try:
             self.__items.remove(item)
-            return True
-        return False
+        except ValueError:
+            return False
+        return True
 
     def get_items(self):
         # type: () -> list
         return self.__items
 
-    def __str__(self):
-        # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
-
     def clone(self):
         # type: () -> ItemInventory
         return copy.deepcopy(self)
@@ -833,7 +722,7 @@ class ItemInventory:
 ###########################################
 
 
-class BattleTeam:
+class BattleTeam(ReprMixin):
     """
     This class contains attributes of a team brought to battles.
     """
@@ -859,9 +748,8 @@ class BattleTeam:
     def add_legendary_creature(self, legendary_creature):
         # type: (LegendaryCreature) -> bool
         if len(self.__legendary_creatures) < self.MAX_LEGENDARY_CREATURES:
-            legendary_creature_ids: list = [creature.legendary_creature_id for creature
-                                            in self.__legendary_creatures]
-            if legendary_creature.legendary_creature_id not in legendary_creature_ids:
+            if not any(creature.legendary_creature_id == legendary_creature.legendary_creature_id for creature
+                       in self.__legendary_creatures):
                 self.__legendary_creatures.append(legendary_creature)
                 self.set_leader()
                 return True
@@ -870,30 +758,17 @@ class BattleTeam:
 
     def remove_legendary_creature(self, legendary_creature):
         # type: (LegendaryCreature) -> bool
-        if legendary_creature in self.__legendary_creatures:
+        try:
             self.__legendary_creatures.remove(legendary_creature)
-            self.set_leader()
-            return True
-        return False
+        except ValueError:
+            return False
+        self.set_leader()
+        return True
 
     def get_legendary_creatures(self):
         # type: () -> list
         return self.__legendary_creatures
 
-    def __str__(self):
-        # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
-
     def clone(self):
         # type: () -> BattleTeam
         return copy.deepcopy(self)
@@ -909,19 +784,19 @@ class LegendaryCreature:
     MIN_CRIT_RATE: mpf = mpf("0.15")
     MIN_CRIT_DAMAGE: mpf = mpf("1.5")
     MIN_RESISTANCE: mpf = mpf("0.15")
-    MAX_RESISTANCE: mpf = mpf("1")
-    MIN_ACCURACY: mpf = mpf("0")
-    MAX_ACCURACY: mpf = mpf("1")
-    MIN_ATTACK_GAUGE: mpf = mpf("0")
-    FULL_ATTACK_GAUGE: mpf = mpf("1")
-    MIN_EXTRA_TURN_CHANCE: mpf = mpf("0")
-    MAX_EXTRA_TURN_CHANCE: mpf = mpf("0.5")
-    MIN_COUNTERATTACK_CHANCE: mpf = mpf("0")
-    MAX_COUNTERATTACK_CHANCE: mpf = mpf("1")
-    MIN_REFLECTED_DAMAGE_PERCENTAGE: mpf = mpf("0")
-    MIN_LIFE_DRAIN_PERCENTAGE: mpf = mpf("0")
-    MIN_CRIT_RESIST: mpf = mpf("0")
-    MAX_CRIT_RESIST: mpf = mpf("1")
+    MAX_RESISTANCE: mpf = MPF_ONE
+    MIN_ACCURACY: mpf = MPF_ZERO
+    MAX_ACCURACY: mpf = MPF_ONE
+    MIN_ATTACK_GAUGE: mpf = MPF_ZERO
+    FULL_ATTACK_GAUGE: mpf = MPF_ONE
+    MIN_EXTRA_TURN_CHANCE: mpf = MPF_ZERO
+    MAX_EXTRA_TURN_CHANCE: mpf = MPF_HALF
+    MIN_COUNTERATTACK_CHANCE: mpf = MPF_ZERO
+    MAX_COUNTERATTACK_CHANCE: mpf = MPF_ONE
+    MIN_REFLECTED_DAMAGE_PERCENTAGE: mpf = MPF_ZERO
+    MIN_LIFE_DRAIN_PERCENTAGE: mpf = MPF_ZERO
+    MIN_CRIT_RESIST: mpf = MPF_ZERO
+    MAX_CRIT_RESIST: mpf = MPF_ONE
     MIN_BENEFICIAL_EFFECTS: int = 0
     MAX_BENEFICIAL_EFFECTS: int = 10
     MIN_HARMFUL_EFFECTS: int = 0
@@ -929,12 +804,12 @@ class LegendaryCreature:
     POTENTIAL_ELEMENTS: list = ["TERRA", "FLAME", "SEA", "NATURE", "ELECTRIC", "ICE", "METAL", "DARK", "LIGHT", "WAR",
                                 "PURE", "LEGEND", "PRIMAL", "WIND", "BEAUTY", "MAGIC", "CHAOS", "HAPPY", "DREAM",
                                 "SOUL"]
-    DEFAULT_MAX_HP_PERCENTAGE_UP: mpf = mpf("0")
-    DEFAULT_MAX_MAGIC_POINTS_PERCENTAGE_UP: mpf = mpf("0")
-    DEFAULT_ATTACK_POWER_PERCENTAGE_UP: mpf = mpf("0")
-    DEFAULT_ATTACK_SPEED_PERCENTAGE_UP: mpf = mpf("0")
-    DEFAULT_DEFENSE_PERCENTAGE_UP: mpf = mpf("0")
-    DEFAULT_CRIT_DAMAGE_UP: mpf = mpf("0")
+    DEFAULT_MAX_HP_PERCENTAGE_UP: mpf = MPF_ZERO
+    DEFAULT_MAX_MAGIC_POINTS_PERCENTAGE_UP: mpf = MPF_ZERO
+    DEFAULT_ATTACK_POWER_PERCENTAGE_UP: mpf = MPF_ZERO
+    DEFAULT_ATTACK_SPEED_PERCENTAGE_UP: mpf = MPF_ZERO
+    DEFAULT_DEFENSE_PERCENTAGE_UP: mpf = MPF_ZERO
+    DEFAULT_CRIT_DAMAGE_UP: mpf = MPF_ZERO
 
 
 class Skill:
@@ -1202,30 +1077,19 @@ class SectionTile:
 ###########################################
 
 
-class GameCharacter:
+class GameCharacter(ReprMixin):
     """
     This class contains attributes of a game character in this game.
     """
 
+    __slots__ = _FIELDS = ("game_character_id", "name", "adventure_mode_location")
+
     def __init__(self, name, adventure_mode_location):
         # type: (str, AdventureModeLocation or None) -> None
-        self.game_character_id: str = str(uuid.uuid1())  # generating random game character ID
+        self.game_character_id: str = uuid.uuid4().hex  # generating random game character ID
         self.name: str = name
-        self.adventure_mode_location: AdventureModeLocation or None = adventure_mode_location
-
-    def __str__(self):
-        # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
+        self.adventure_mode_location: AdventureModeLocation = NO_LOCATION if adventure_mode_location is None \
+            else adventure_mode_location
 
     def clone(self):
         # type: () -> GameCharacter
@@ -1237,6 +1101,9 @@ class NPC(GameCharacter):
     This class contains attributes of a non-player character (NPC).
     """
 
+    __slots__ = ("message",)
+    _FIELDS: tuple = GameCharacter._FIELDS + __slots__
+
     def __init__(self, name, adventure_mode_location, message):
         # type: (str, AdventureModeLocation, str) -> None
         GameCharacter.__init__(self, name, adventure_mode_location)
@@ -1265,11 +1132,16 @@ class CPUTrainer(Trainer):
     """
 
 
-class AdventureModeLocation:
+class AdventureModeLocation(ReprMixin):
     """
-    This class contains attributes of the location of a game character in adventure mode of this game.
+    This class contains attributes of the location of a game character in adventure mode of this game. Locations
+    may be shared between game characters (e.g. NO_LOCATION), so a game character is moved by assigning it a new
+    location rather than by changing its current location in place.
     """
 
+    __slots__ = _FIELDS = ("planet", "city_index", "city_tile_x", "city_tile_y", "floor_index", "floor_tile_x",
+                           "floor_tile_y")
+
     def __init__(self, planet, city_index, city_tile_x, city_tile_y, floor_index, floor_tile_x, floor_tile_y):
         # type: (Planet, int, int, int, int, int, int) -> None
         self.planet: Planet = planet
@@ -1280,23 +1152,57 @@ class AdventureModeLocation:
         self.floor_tile_x: int = floor_tile_x
         self.floor_tile_y: int = floor_tile_y
 
-    def __str__(self):
-        # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
+    def __deepcopy__(self, memo):
+        # type: (dict) -> AdventureModeLocation
+        # The game has a single planet which every location refers to, so the copy always shares it rather than
+        # copying the whole world, even when the planet is copied too. All the other attributes are integers.
+        new_location: AdventureModeLocation = type(self).__new__(type(self))
+        for field in self._FIELDS:
+            setattr(new_location, field, getattr(self, field))
+        return new_location
+
+    def clone(self):
+        # type: () -> AdventureModeLocation
+        return copy.deepcopy(self)
 
-            if index < len(vars(self).items()) - 1:
-                res += ", "
 
-            index += 1
+class NoAdventureModeLocation(AdventureModeLocation):
+    """
+    This class contains attributes of the read-only location shared by game characters who are not anywhere in
+    adventure mode. NO_LOCATION is its only instance.
+    """
 
-        return res + ")"
+    __slots__ = ()
+
+    def __init__(self):
+        # type: () -> None
+        for field in self._FIELDS:
+            object.__setattr__(self, field, None if field == "planet" else -1)
+
+    def __setattr__(self, name, value):
+        # type: (str, object) -> None
+        raise AttributeError("NO_LOCATION is shared by game characters and cannot be changed")
+
+    def __delattr__(self, name):
+        # type: (str) -> None
+        raise AttributeError("NO_LOCATION is shared by game characters and cannot be changed")
+
+    def __reduce_ex__(self, protocol):
+        # type: (int) -> str
+        # NO_LOCATION is pickled by reference so that "is NO_LOCATION" checks still hold after loading and cloning.
+        return "NO_LOCATION"
+
+    def __deepcopy__(self, memo):
+        # type: (dict) -> NoAdventureModeLocation
+        return self  # read-only, so it is never copied
 
     def clone(self):
-        # type: () -> AdventureModeLocation
-        return copy.deepcopy(self)
+        # type: () -> NoAdventureModeLocation
+        return self  # read-only, so it is never copied
+
+
+# Location of game characters who are not anywhere in adventure mode.
+NO_LOCATION: NoAdventureModeLocation = NoAdventureModeLocation()
 
 
 class Jail:
@@ -1311,40 +1217,54 @@ class Hospital:
     """
 
 
-class AwardCondition:
+class AwardCondition(ReprMixin):
     """
     This class contains attributes of a condition for an award to be achieved.
     """
 
+    __slots__ = ("__checked_player_attribute", "min_value", "_player_attribute_getter")
+    _FIELDS: tuple = ("checked_player_attribute", "min_value")
+
     def __init__(self, checked_player_attribute, min_value):
         # type: (str, int) -> None
         self.checked_player_attribute: str = checked_player_attribute
         self.min_value: int = min_value
 
-    def __str__(self):
+    @property
+    def checked_player_attribute(self):
         # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
+        return self.__checked_player_attribute
 
-        return res + ")"
+    @checked_player_attribute.setter
+    def checked_player_attribute(self, checked_player_attribute):
+        # type: (str) -> None
+        self.__checked_player_attribute = checked_player_attribute
+        # The getter reads the player attribute exactly like getattr(). attrgetter follows dots in the attribute name,
+        # so names with dots are looked up as a whole by __getattribute__ instead.
+        self._player_attribute_getter = attrgetter(checked_player_attribute) if "." not in checked_player_attribute \
+            else methodcaller("__getattribute__", checked_player_attribute)
+
+    def __deepcopy__(self, memo):
+        # type: (dict) -> AwardCondition
+        # All attributes of an award condition are immutable, so they can be shared with the copy.
+        new_condition: AwardCondition = type(self).__new__(type(self))
+        new_condition.__checked_player_attribute = self.__checked_player_attribute
+        new_condition.min_value = self.min_value
+        new_condition._player_attribute_getter = self._player_attribute_getter
+        return new_condition
 
     def clone(self):
         # type: () -> AwardCondition
         return copy.deepcopy(self)
 
 
-class Award:
+class Award(ReprMixin):
     """
     This class contains attributes of an award a player can get for achieving something.
     """
 
+    __slots__ = _FIELDS = ("name", "description", "condition")
+
     def __init__(self, name, description, condition):
         # type: (str, str, AwardCondition) -> None
         self.name: str = name
@@ -1354,36 +1274,27 @@ class Award:
     def condition_is_met(self, trainer):
         # type: (Trainer) -> bool
         try:
-            return getattr(trainer, str(self.condition.checked_player_attribute)) >= self.condition.min_value
+            return self.condition._player_attribute_getter(trainer) >= self.condition.min_value
         except AttributeError:
             return False
 
-    def __str__(self):
-        # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
-
     def clone(self):
         # type: () -> Award
         return copy.deepcopy(self)
 
 
-class ResourceReward:
+class ResourceReward(ReprMixin):
     """
     This class contains attributes of the resources gained for doing something.
     """
 
-    def __init__(self, player_reward_exp=mpf("0"), player_reward_dollars=mpf("0"),
-                 legendary_creature_reward_exp=mpf("0"), player_reward_items=None):
+    __slots__ = ("player_reward_exp", "player_reward_dollars", "legendary_creature_reward_exp",
+                 "__player_reward_items")
+    _FIELDS: tuple = ("player_reward_exp", "player_reward_dollars", "legendary_creature_reward_exp",
+                      "_ResourceReward__player_reward_items")
+
+    def __init__(self, player_reward_exp=MPF_ZERO, player_reward_dollars=MPF_ZERO,
+                 legendary_creature_reward_exp=MPF_ZERO, player_reward_items=None):
         # type: (mpf, mpf, mpf, list) -> None
         if player_reward_items is None:
             player_reward_items = []
@@ -1397,44 +1308,16 @@ class ResourceReward:
         # type: () -> list
         return self.__player_reward_items
 
-    def __str__(self):
-        # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
-
     def clone(self):
         # type: () -> ResourceReward
         return copy.deepcopy(self)
 
 
-class Game:
+class Game(ReprMixin):
     """
     This class contains attributes of saved game data.
     """
 
-    def __str__(self):
-        # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
-
     def clone(self):
         # type: () -> Game
         return copy.deepcopy(self)
@@ -1458,13 +1341,11 @@ def main() -> int:
     print("This game is an offline adventure and simulation RPG allowing the player to ")
     print("choose various real-life actions.")
     print("Below is the element chart in 'Adventure Mode' of 'Life Simulation'.\n")
-    print(str(tabulate_element_chart()) + "\n")
+    print(tabulate_element_chart() + "\n")
     print("The following elements do not have any elemental strengths nor weaknesses.")
     print("This is because they are ancient world elements. In this case, these elements will always ")
     print("be dealt with normal damage.\n")
-    ancient_world_elements: list = ["BEAUTY", "MAGIC", "CHAOS", "HAPPY", "DREAM", "SOUL"]
-    for i in range(0, len(ancient_world_elements)):
-        print(str(i + 1) + ". " + str(ancient_world_elements[i]))
+    print("\n".join(str(i) + ". " + element for i, element in enumerate(ANCIENT_WORLD_ELEMENTS, 1)))
 
     return 0
 
@@ -1,10 +1,169 @@
 import unittest
 
+from mpmath import mpf
 
-class MyTestCase(unittest.TestCase):
-    def test_something(self):
-        self.assertEqual(True, False)  # add assertion here
+from life_simulation import NO_LOCATION, AdventureModeLocation, Award, AwardCondition, City, CityTile, Floor, \
+    Game, GameCharacter, GrassTile, LegendaryCreature, NormalFloorTile, PavementTile, Planet, Trainer, WildFloorTile, \
+    get_elemental_damage_multiplier, mpf_product_of_list, mpf_sum_of_list
 
 
+class MpfListTestCase(unittest.TestCase):
+    def test_sum_skips_non_numeric_elements_and_booleans(self):
+        self.assertEqual(mpf("10"), mpf_sum_of_list([1, 2, "3", mpf("4"), "x", None, True, [1]]))
+
+    def test_sum_of_empty_list(self):
+        self.assertEqual(mpf("0"), mpf_sum_of_list([]))
+
+    def test_product_skips_non_numeric_elements(self):
+        self.assertEqual(mpf("3"), mpf_product_of_list([2, "3", "x", None, [1], mpf("0.5")]))
+
+    def test_product_multiplies_booleans(self):
+        self.assertEqual(mpf("0"), mpf_product_of_list([5, False]))
+        self.assertEqual(mpf("5"), mpf_product_of_list([5, True]))
+
+    def test_product_of_empty_list(self):
+        self.assertEqual(mpf("1"), mpf_product_of_list([]))
+
+
+class ElementalDamageMultiplierTestCase(unittest.TestCase):
+    # Elemental strengths and weaknesses of each attacking element, as listed in the element chart.
+    RULES: dict = {
+        "TERRA": (["ELECTRIC", "DARK"], ["METAL", "WAR"]),
+        "FLAME": (["NATURE", "ICE"], ["SEA", "WAR"]),
+        "SEA": (["FLAME", "WAR"], ["NATURE", "ELECTRIC"]),
+        "NATURE": (["SEA", "LIGHT"], ["FLAME", "ICE"]),
+        "ELECTRIC": (["SEA", "METAL"], ["TERRA", "LIGHT"]),
+        "ICE": (["NATURE", "WAR"], ["FLAME", "METAL"]),
+        "METAL": (["TERRA", "ICE"], ["ELECTRIC", "DARK"]),
+        "DARK": (["METAL", "LIGHT"], ["TERRA"]),
+        "LIGHT": (["ELECTRIC", "DARK"], ["NATURE"]),
+        "WAR": (["TERRA", "FLAME"], ["SEA", "ICE"]),
+        "PURE": (["LEGEND"], ["PRIMAL"]),
+        "LEGEND": (["PRIMAL"], ["PURE"]),
+        "PRIMAL": (["PURE"], ["LEGEND"]),
+        "WIND": (["WIND"], [])
+    }
+
+    def test_multipliers_match_element_chart(self):
+        for element1 in LegendaryCreature.POTENTIAL_ELEMENTS:
+            double_damage_elements, half_damage_elements = self.RULES.get(element1, ([], []))
+            for element2 in LegendaryCreature.POTENTIAL_ELEMENTS:
+                expected: float = 2.0 if element2 in double_damage_elements else 0.5 \
+                    if element2 in half_damage_elements else 1.0
+                self.assertEqual(expected, get_elemental_damage_multiplier(element1, element2),
+                                 msg=element1 + " against " + element2)
+
+    def test_terra_deals_double_damage_to_electric_and_dark(self):
+        self.assertEqual(2.0, get_elemental_damage_multiplier("TERRA", "ELECTRIC"))
+        self.assertEqual(2.0, get_elemental_damage_multiplier("TERRA", "DARK"))
+
+    def test_unknown_elements_deal_normal_damage(self):
+        self.assertEqual(1.0, get_elemental_damage_multiplier("BEAUTY", "TERRA"))
+        self.assertEqual(1.0, get_elemental_damage_multiplier("UNKNOWN", "UNKNOWN"))
+
+
+class AwardTestCase(unittest.TestCase):
+    def setUp(self):
+        self.trainer: Trainer = Trainer("TRAINER", None)
+        self.trainer.level = 5
+        self.trainer.wins = 2
+        self.award: Award = Award("AWARD", "DESCRIPTION", AwardCondition("level", 5))
+
+    def test_condition_is_met(self):
+        self.assertTrue(self.award.condition_is_met(self.trainer))
+        self.award.condition.min_value = 6
+        self.assertFalse(self.award.condition_is_met(self.trainer))
+
+    def test_changed_checked_player_attribute_is_used(self):
+        self.award.condition.checked_player_attribute = "wins"
+        self.assertFalse(self.award.condition_is_met(self.trainer))
+        self.assertEqual("AwardCondition(checked_player_attribute=wins, min_value=5)", str(self.award.condition))
+        self.assertEqual("wins", self.award.clone().condition.checked_player_attribute)
+
+    def test_missing_or_dotted_player_attribute_is_not_met(self):
+        for checked_player_attribute in ["losses", "level.real"]:
+            award: Award = Award("AWARD", "DESCRIPTION", AwardCondition(checked_player_attribute, 0))
+            self.assertFalse(award.condition_is_met(self.trainer), msg=checked_player_attribute)
+
+
+class FloorTestCase(unittest.TestCase):
+    def test_get_tile_at_within_bounds(self):
+        wild_floor_tile: WildFloorTile = WildFloorTile()
+        floor: Floor = Floor("FLOOR", [[NormalFloorTile(), wild_floor_tile], [NormalFloorTile(), NormalFloorTile()]])
+        self.assertIs(wild_floor_tile, floor.get_tile_at(1, 0))
+
+    def test_get_tile_at_out_of_bounds(self):
+        floor: Floor = Floor("FLOOR", [[NormalFloorTile(), NormalFloorTile()]])
+        self.assertIsNone(floor.get_tile_at(2, 0))
+        self.assertIsNone(floor.get_tile_at(0, 1))
+        self.assertIsNone(floor.get_tile_at(-1, 0))
+
+    def test_get_tile_at_on_empty_floor(self):
+        self.assertIsNone(Floor("FLOOR", []).get_tile_at(0, 0))
+
+    def test_str_only_shows_floor_attributes(self):
+        self.assertEqual("Floor(name=FLOOR, _Floor__floor_tiles=[])", str(Floor("FLOOR", [])))
+
+
+class CityTileTestCase(unittest.TestCase):
+    def test_add_and_remove_game_character(self):
+        for city_tile in [CityTile(), GrassTile(), PavementTile()]:
+            game_character: GameCharacter = GameCharacter("CHARACTER", None)
+            city_tile.add_game_character(game_character)
+            self.assertEqual([game_character], city_tile.get_game_characters())
+            self.assertTrue(city_tile.remove_game_character(game_character))
+            self.assertEqual([], city_tile.get_game_characters())
+
+    def test_remove_absent_game_character(self):
+        for city_tile in [CityTile(), GrassTile(), PavementTile()]:
+            self.assertFalse(city_tile.remove_game_character(GameCharacter("CHARACTER", None)))
+
+
+class GameCharacterTestCase(unittest.TestCase):
+    def test_unplaced_game_characters_share_read_only_location(self):
+        game_character1: GameCharacter = GameCharacter("CHARACTER 1", None)
+        game_character2: GameCharacter = GameCharacter("CHARACTER 2", None)
+        self.assertIs(NO_LOCATION, game_character1.adventure_mode_location)
+        with self.assertRaises(AttributeError):
+            game_character1.adventure_mode_location.city_index = 7
+        self.assertEqual(-1, game_character2.adventure_mode_location.city_index)
+
+    def test_clone_keeps_no_location(self):
+        game_character: GameCharacter = GameCharacter("CHARACTER", None)
+        self.assertIs(NO_LOCATION, game_character.clone().adventure_mode_location)
+        self.assertIs(NO_LOCATION, NO_LOCATION.clone())
+
+
+class AdventureModeLocationTestCase(unittest.TestCase):
+    def setUp(self):
+        self.city_tile: GrassTile = GrassTile()
+        self.planet: Planet = Planet("PLANET", [City("CITY", [[self.city_tile]])])
+        self.adventure_mode_location: AdventureModeLocation = AdventureModeLocation(self.planet, 0, 0, 0, -1, -1, -1)
+        self.game_character: GameCharacter = GameCharacter("CHARACTER", self.adventure_mode_location)
+        self.city_tile.add_game_character(self.game_character)
+
+    def test_cloned_location_shares_planet(self):
+        self.assertIs(self.planet, self.adventure_mode_location.clone().planet)
+
+    def test_cloned_game_character_location_shares_planet(self):
+        self.assertIs(self.planet, self.game_character.clone().adventure_mode_location.planet)
+
+    def test_cloned_planet_is_not_referred_to_by_cloned_locations(self):
+        new_planet: Planet = self.planet.clone()
+        new_city_tile: GrassTile = new_planet.get_cities()[0].get_tiles()[0][0]
+        self.assertIsNot(self.planet, new_planet)
+        self.assertIs(self.planet, new_city_tile.get_game_characters()[0].adventure_mode_location.planet)
+
+    def test_cloned_game_locations_share_planet_whichever_is_copied_first(self):
+        # Game attributes are copied in the order they were assigned, so both orders are tried.
+        for game_attributes in [{"game_characters": [self.game_character], "planet": self.planet},
+                                {"planet": self.planet, "game_characters": [self.game_character]}]:
+            game: Game = Game()
+            vars(game).update(game_attributes)
+            new_game: Game = game.clone()
+            new_city_tile: GrassTile = new_game.planet.get_cities()[0].get_tiles()[0][0]
+            self.assertIs(self.planet, new_game.game_characters[0].adventure_mode_location.planet)
+            self.assertIs(self.planet, new_city_tile.get_game_characters()[0].adventure_mode_location.planet)
+
 if __name__ == '__main__':
     unittest.main()